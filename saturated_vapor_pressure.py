@@ -23,21 +23,685 @@
 #
 #    The current default formulas are `Hyland and Wexler` for liquid and `Goff Gratch` for ice. (hv20040521)
 #
+#    If numba is installed, the scalar kernels behind `vapor_pressure_elementwise` are compiled
+#    to machine code on first use and cached on disk, and `vapor_pressure_ufunc` is available.
+#
+#    Temperatures at and below absolute zero give NaN, with or without numba. Far outside
+#    the valid range of a formula (e.g. above the critical point for IAPWS, or where the
+#    exponent overflows), the plain python kernels raise `ValueError` or `OverflowError`
+#    from `math`, while the numba kernels return NaN or inf like the array kernels.
+#
 
+import functools
 import math
+import os
 import numpy as np
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union
+
+try:
+    import numba
+except ImportError:  # numba is optional, the kernels then run as plain python
+    numba = None
+
+
+def _jit(function: Callable, cache: bool = True) -> Callable:
+    """[compile a scalar kernel to machine code with numba, if it is installed.]
+
+    Args:
+        function (Callable): [scalar kernel using only `math` functions and arithmetic]
+        cache (bool, optional): [cache the machine code on disk, not possible for closures]. Defaults to True.
+
+    Returns:
+        Callable: [compiled kernel, or the kernel itself without numba]
+    """
+    if numba is None:
+        return function
+    # All fast-math flags except "nnan" and "ninf", so NaN and inf temperatures still
+    # propagate the same way as without numba. The numpy error model skips the
+    # division-by-zero checks and returns inf/NaN like the array kernels do.
+    return numba.njit(
+        cache=cache,
+        fastmath={"nsz", "arcp", "contract", "afn", "reassoc"},
+        error_model="numpy",
+    )(function)
+
+
+# -------------------------------------------------------------------------------------------
+#    Constants
+# -------------------------------------------------------------------------------------------
+# Computed once at import instead of on every call.
+
+_LN10 = math.log(10.0)
+
+_TEMPERATURE_TRIPLE_POINT = 273.16  # triple point of water [K]
+_TEMPERATURE_STEAM_POINT = 373.16  # steam point temperature [K]
+_TEMPERATURE_CRITICAL_POINT = 647.096  # temperature at the critical point [K]
+_PRESSURE_CRITICAL_POINT = 22.064e4  # vapor pressure at the critical point [hPa]
+
+# Reciprocals, so that the temperature ratios multiply instead of divide
+_INVERSE_TEMPERATURE_TRIPLE_POINT = 1.0 / _TEMPERATURE_TRIPLE_POINT
+_INVERSE_TEMPERATURE_STEAM_POINT = 1.0 / _TEMPERATURE_STEAM_POINT
+_INVERSE_TEMPERATURE_CRITICAL_POINT = 1.0 / _TEMPERATURE_CRITICAL_POINT
+
+# log10 of the saturation pressure at the steam point, normal atmosphere (Goff Gratch) [hPa]
+_LOG10_E_WATER_SATURATION = math.log10(1013.246)
+
+# log10 of the saturation pressure over ice at the triple point (Goff Gratch) [hPa]
+_LOG10_E_ICE_0 = math.log10(6.1071)
+
+# McIDAS polynomial coefficients, in increasing powers of the temperature in [C]
+_MCIDAS_LIQUID_COEFFICIENTS = (
+    0.999996876e0,
+    -0.9082695004e-2,
+    0.7873616869e-4,
+    -0.6111795727e-6,
+    0.4388418740e-8,
+    -0.2988388486e-10,
+    0.2187442495e-12,
+    -0.1789232111e-14,
+    0.1111201803e-16,
+    -0.3099457145e-19,
+)
+_MCIDAS_ICE_COEFFICIENTS = (
+    0.7859063157e0,
+    0.3579242320e-1,
+    -0.1292820828e-3,
+    0.5937519208e-6,
+    0.4482949133e-9,
+    0.2176664827e-10,
+)
+
+
+# -------------------------------------------------------------------------------------------
+#    Scalar kernels
+# -------------------------------------------------------------------------------------------
+# Each kernel takes the temperature in [C] and in [K] and returns the saturation vapor
+# pressure in [hPa] for a single (phase, formula) pair.
+
+
+@_jit
+def _horner(x: float, coefficients: Tuple[float, ...]) -> float:
+    """[evaluate a polynomial with Horner's scheme.]
+
+    Args:
+        x (float): [value to evaluate the polynomial at]
+        coefficients (Tuple[float, ...]): [coefficients in increasing powers of x]
+
+    Returns:
+        float: [value of the polynomial]
+    """
+    result = coefficients[-1]
+    for coefficient in coefficients[-2::-1]:
+        result = result * x + coefficient
+    return result
+
+
+@_jit
+def _hyland_wexler_liquid(temperature_c: float, temperature_k: float) -> float:
+    # Source Hyland, R. W. and A. Wexler, Formulations for the Thermodynamic Properties of the saturated Phases of H2O from 173.15K to 473.15K, ASHRAE Trans, 89(2A), 500-519, 1983.
+    return (
+        math.exp(
+            -0.58002206e4 / temperature_k
+            + 0.13914993e1
+            + temperature_k
+            * (
+                -0.48640239e-1
+                + temperature_k * (0.41764768e-4 - 0.14452093e-7 * temperature_k)
+            )
+            + 0.65459673e1 * math.log(temperature_k)
+        )
+        / 100.0
+    )
+
+
+@_jit
+def _hardy_liquid(temperature_c: float, temperature_k: float) -> float:
+    # Source Hardy, B., 1998, ITS-90 Formulations for Vapor Pressure, Frostpoint temperature, Dewpoint temperature, and Enhancement Factors in the Range −100 to 100° C.
+    # The Proceedings of the Third International Symposium on Humidity & Moisture, London, England
+    return (
+        math.exp(
+            (-6.028076559e3 - 2.8365744e3 / temperature_k) / temperature_k
+            + 1.954263612e1
+            + temperature_k
+            * (
+                -2.737830188e-2
+                + temperature_k
+                * (
+                    1.6261698e-5
+                    + temperature_k * (7.0229056e-10 - 1.8680009e-13 * temperature_k)
+                )
+            )
+            + 2.7150305 * math.log(temperature_k)
+        )
+        / 100.0
+    )
+
+
+@_jit
+def _preining_liquid(temperature_c: float, temperature_k: float) -> float:
+    # Source : Vehkamaeki, H., M. Kulmala, I. Napari, K. E. J. Lehtinen, C.Timmreck, M. Noppel, and A. Laaksonen (2002), J. Geophys. Res., 107, doi:10.1029/2002JD002184.
+    return (
+        math.exp(
+            -7235.424651 / temperature_k
+            + 77.34491296
+            + 5.7113e-3 * temperature_k
+            - 8.2 * math.log(temperature_k)
+        )
+        / 100.0
+    )
+
+
+@_jit
+def _wexler_liquid(temperature_c: float, temperature_k: float) -> float:
+    # Wexler, A., Vapor Pressure Formulation for Water in Range 0 to 100 C. A Revision, Journal of Research of the National Bureau of Standards - A. Physics and Chemistry, September - December 1976, Vol. 80A, Nos.5 and 6, 775-785
+    # The line of `T**4` was corrected from '-' to '+' following the original citation. (HV 20140819). The change makes only negligible difference
+    return (
+        math.exp(
+            (-0.60170128e4 - 0.29912729e4 / temperature_k) / temperature_k
+            + 0.1887643854e2
+            + temperature_k
+            * (
+                -0.28354721e-1
+                + temperature_k
+                * (
+                    0.17838301e-4
+                    + temperature_k * (-0.84150417e-9 + 0.44412543e-12 * temperature_k)
+                )
+            )
+            + 2.858487 * math.log(temperature_k)
+        )
+        / 100.0
+    )
+
+
+@_jit
+def _goff_gratch_liquid(temperature_c: float, temperature_k: float) -> float:
+    # Goff Gratch formulation
+    # Source : Smithsonian Meteorological Tables, 5th edition, p. 350, 1984
+    # From original source: Goff and Gratch (1946), p. 107.
+    ratio = _TEMPERATURE_STEAM_POINT / temperature_k
+    inverse_ratio = temperature_k * _INVERSE_TEMPERATURE_STEAM_POINT
+
+    # 10 ** x is evaluated as exp(x * ln(10)), and 10 ** x - 1 as expm1(x * ln(10))
+    return math.exp(
+        _LN10
+        * (
+            -7.90298 * (ratio - 1.0)
+            + 5.02808 * math.log10(ratio)
+            - 1.3816e-7 * math.expm1(11.344 * _LN10 * (1.0 - inverse_ratio))
+            + 8.1328e-3 * math.expm1(-3.49149 * _LN10 * (ratio - 1.0))
+            + _LOG10_E_WATER_SATURATION
+        )
+    )
+
+
+@_jit
+def _cimo_liquid(temperature_c: float, temperature_k: float) -> float:
+    # Source: Annex 4B, Guide to Meteorological Instruments and Methods of Observation, WMO Publication No 8, 7th edition, Geneva, 2008. (CIMO Guide)
+    return 6.112 * math.exp(17.62 * temperature_c / (243.12 + temperature_c))
+
+
+@_jit
+def _magnus_tetens_liquid(temperature_c: float, temperature_k: float) -> float:
+    # Source: Murray, F. W., On the computation of saturation vapor pressure, J. Appl. Meteorol., 6, 203-204, 1967.
+    # p_saturation = 10.**(7.5*(temperature_c)/(temperature_c+237.5) + 0.7858)         ; Murray quotes this as the original formula and
+    return 6.1078 * math.exp(
+        17.269388
+        * (temperature_k - _TEMPERATURE_TRIPLE_POINT)
+        / (temperature_k - 35.86)
+    )  # this as the mathematical equivalent in the form of base e.
+
+
+@_jit
+def _buck_liquid(temperature_c: float, temperature_k: float) -> float:
+    # Bucks vapor pressure formulation based on Tetens formula
+    # Source: Buck, A. L., New equations for computing vapor pressure and enhancement factor, J. Appl. Meteorol., 20, 1527-1532, 1981.
+    return 6.1121 * math.exp(17.502 * temperature_c / (240.97 + temperature_c))
+
+
+@_jit
+def _buck2_liquid(temperature_c: float, temperature_k: float) -> float:
+    # Bucks vapor pressure formulation based on Tetens formula
+    # Source: Buck Research, Model CR-1A Hygrometer Operating Manual, Sep 2001
+    return 6.1121 * math.exp(
+        (18.678 - temperature_c / 234.5) * temperature_c / (257.14 + temperature_c)
+    )
+
+
+@_jit
+def _wmo_liquid(temperature_c: float, temperature_k: float) -> float:
+    # Intended WMO formulation, originally published by Goff (1957)
+    # incorrectly referenced by WMO technical regulations, WMO-NO 49, Vol I, General Meteorological Standards and Recommended Practices, App. A, Corrigendum Aug 2000.
+    # and incorrectly referenced by WMO technical regulations, WMO-NO 49, Vol I, General Meteorological Standards and Recommended Practices, App. A, 1988.
+    ratio = _TEMPERATURE_TRIPLE_POINT / temperature_k
+    inverse_ratio = temperature_k * _INVERSE_TEMPERATURE_TRIPLE_POINT
+
+    # 10 ** x is evaluated as exp(x * ln(10)), and 10 ** x - 1 as expm1(x * ln(10))
+    return math.exp(
+        _LN10
+        * (
+            10.79574 * (1.0 - ratio)
+            - 5.02800 * math.log10(inverse_ratio)
+            - 1.50475e-4 * math.expm1(-8.2969 * _LN10 * (inverse_ratio - 1.0))
+            + 0.42873e-3 * math.expm1(+4.76955 * _LN10 * (1.0 - ratio))
+            + 0.78614
+        )
+    )
+
+
+@_jit
+def _wmo2000_liquid(temperature_c: float, temperature_k: float) -> float:
+    # WMO formulation, which is very similar to Goff Gratch
+    # Source : WMO technical regulations, WMO-NO 49, Vol I, General Meteorological Standards and Recommended Practices, App. A, Corrigendum Aug 2000.
+    ratio = _TEMPERATURE_TRIPLE_POINT / temperature_k
+    inverse_ratio = temperature_k * _INVERSE_TEMPERATURE_TRIPLE_POINT
+
+    # 10 ** x is evaluated as exp(x * ln(10)), and 10 ** x - 1 as expm1(x * ln(10))
+    return math.exp(
+        _LN10
+        * (
+            10.79574 * (1.0 - ratio)
+            - 5.02800 * math.log10(inverse_ratio)
+            - 1.50475e-4 * math.expm1(-8.2969 * _LN10 * (inverse_ratio - 1.0))
+            + 0.42873e-3 * math.expm1(-4.76955 * _LN10 * (1.0 - ratio))
+            + 0.78614
+        )
+    )
+
+
+@_jit
+def _sonntag_liquid(temperature_c: float, temperature_k: float) -> float:
+    # Source: Sonntag, D., Advancements in the field of hygrometry, Meteorol. Z., N. F., 3, 51-66, 1994.
+    return math.exp(
+        -6096.9385 / temperature_k
+        + 16.635794
+        + temperature_k * (-2.711193e-2 + 1.673952e-5 * temperature_k)
+        + 2.433502 * math.log(temperature_k)
+    )
+
+
+@_jit
+def _bolton_liquid(temperature_c: float, temperature_k: float) -> float:
+    # Source: Bolton, D., The computation of equivalent potential temperature, Monthly Weather Report, 108, 1046-1053, 1980. equation (10)
+    return 6.112 * math.exp(17.67 * temperature_c / (temperature_c + 243.5))
+
+
+@_jit
+def _fukuta_liquid(temperature_c: float, temperature_k: float) -> float:
+    # Source: Fukuta, N. and C. M. Gramada, Vapor pressure measurement of supercooled water, J. Atmos. Sci., 60, 1871-1875, 2003.
+    # This paper does not give a vapor pressure formulation, but rather a correction over the Smithsonian Tables.
+    # Thus calculate the table value first, then use the correction to get to the measured value.
+    if temperature_c < -39.0:
+        return math.nan
+
+    pressure_saturation_goff_gratch = _goff_gratch_liquid(temperature_c, temperature_k)
+
+    x = temperature_c + 19
+    return pressure_saturation_goff_gratch * (
+        0.9992
+        + x
+        * (7.113e-4 + x * (-1.847e-4 + x * (1.189e-5 + x * (1.130e-7 - 1.743e-8 * x))))
+    )
+
+
+@_jit
+def _iapws_liquid(temperature_c: float, temperature_k: float) -> float:
+    # Source: Wagner W. and A. Pruss (2002), The IAPWS formulation 1995 for the thermodynamic properties of ordinary water substance for general and scientific use, J. Phys. Chem. Ref. Data, 31(2), 387-535.
+    # This is the 'official' formulation from the International Association for the Properties of Water and Steam
+    # The valid range of this formulation is 273.16 <= T <= 647.096 K and is based on the ITS90 temperature scale.
+    nu = 1 - temperature_k * _INVERSE_TEMPERATURE_CRITICAL_POINT
+    nu_half = math.sqrt(nu)
+    nu_cubed = nu * nu * nu
+    a1 = -7.85951783
+    a2 = 1.84408259
+    a3 = -11.7866497
+    a4 = 22.6807411
+    a5 = -15.9618719
+    a6 = 1.80122502
+    return _PRESSURE_CRITICAL_POINT * math.exp(
+        _TEMPERATURE_CRITICAL_POINT
+        / temperature_k
+        * (
+            nu * (a1 + a2 * nu_half)
+            + nu_cubed * (a3 + a4 * nu_half + nu * (a5 + a6 * nu_cubed * nu_half))
+        )
+    )
+
+
+@_jit
+def _murphy_koop_liquid(temperature_c: float, temperature_k: float) -> float:
+    # Source : Murphy and Koop, Review of the vapour pressure of ice and supercooled water for atmospheric applications, Q. J. R. Meteorol. Soc (2005), 131, pp. 1539-1565.
+    log_temperature_k = math.log(temperature_k)
+    return (
+        math.exp(
+            54.842763
+            - 6763.22 / temperature_k
+            - 4.210 * log_temperature_k
+            + 0.000367 * temperature_k
+            + math.tanh(0.0415 * (temperature_k - 218.8))
+            * (
+                53.878
+                - 1331.22 / temperature_k
+                - 9.44523 * log_temperature_k
+                + 0.014025 * temperature_k
+            )
+        )
+        / 100.0
+    )
+
+
+@_jit
+def _mcidas_liquid(temperature_c: float, temperature_k: float) -> float:
+    # Source : Unknown, Received from Xin Jin <xjin@ssec.wisc.edu>
+    S = _horner(temperature_c, _MCIDAS_LIQUID_COEFFICIENTS)
+    S2 = S * S
+    S4 = S2 * S2
+    return 0.61078e1 / (S4 * S4)
+
+
+@_jit
+def _marti_mauersberger_ice(temperature_c: float, temperature_k: float) -> float:
+    # Source : Marti, J. and K Mauersberger, A survey and new measurements of ice vapor pressure at temperatures between 170 and 250 K, GRL 20, 363-366, 1993.
+    return math.exp(_LN10 * (-2663.5 / temperature_k + 12.537)) / 100.0
+
+
+@_jit
+def _hyland_wexler_ice(temperature_c: float, temperature_k: float) -> float:
+    # Source Hyland, R. W. and A. Wexler, Formulations for the Thermodynamic Properties of the saturated Phases of H2O from 173.15K to 473.15K, ASHRAE Trans, 89(2A), 500-519, 1983.
+    return (
+        math.exp(
+            -0.56745359e4 / temperature_k
+            + 0.63925247e1
+            + temperature_k
+            * (
+                -0.96778430e-2
+                + temperature_k
+                * (
+                    0.62215701e-6
+                    + temperature_k * (0.20747825e-8 - 0.94840240e-12 * temperature_k)
+                )
+            )
+            + 0.41635019e1 * math.log(temperature_k)
+        )
+        / 100.0
+    )
+
+
+@_jit
+def _wexler_ice(temperature_c: float, temperature_k: float) -> float:
+    # Wexler, A., Vapor pressure formulation for ice, Journal of Research of the National Bureau of Standards-A. 81A, 5-20, 1977.
+    return (
+        math.exp(
+            -0.58653696e4 / temperature_k
+            + 0.2224103300e2
+            + temperature_k
+            * (
+                0.13749042e-1
+                + temperature_k * (-0.34031775e-4 + 0.26967687e-7 * temperature_k)
+            )
+            + 0.6918651 * math.log(temperature_k)
+        )
+        / 100.0
+    )
+
+
+@_jit
+def _hardy_ice(temperature_c: float, temperature_k: float) -> float:
+    # Source Hardy, B., 1998, ITS-90 Formulations for Vapor Pressure, Frostpoint temperature, Dewpoint temperature, and Enhancement Factors in the Range 鈥�100 to +100 掳C, The Proceedings of the Third International Symposium on Humidity & Moisture, London, England
+    # These coefficients are updated to ITS90 based on the work by Bob Hardy at Thunder Scientific: http://www.thunderscientific.com/tech_info/reflibrary/its90formulas.pdf
+    # The difference to the older ITS68 coefficients used by Wexler is academic.
+    return (
+        math.exp(
+            -0.58666426e4 / temperature_k
+            + 0.2232870244e2
+            + temperature_k
+            * (
+                0.139387003e-1
+                + temperature_k * (-0.34262402e-4 + 0.27040955e-7 * temperature_k)
+            )
+            + 0.67063522e-1 * math.log(temperature_k)
+        )
+        / 100.0
+    )
+
+
+@_jit
+def _goff_gratch_ice(temperature_c: float, temperature_k: float) -> float:
+    # Source : Smithsonian Meteorological Tables, 5th edition, p. 350, 1984
+    ratio = _TEMPERATURE_TRIPLE_POINT / temperature_k
+
+    # 10 ** x is evaluated as exp(x * ln(10))
+    return math.exp(
+        _LN10
+        * (
+            -9.09718 * (ratio - 1.0)
+            - 3.56654 * math.log10(ratio)
+            + 0.876793 * (1.0 - temperature_k * _INVERSE_TEMPERATURE_TRIPLE_POINT)
+            + _LOG10_E_ICE_0
+        )
+    )
+
+
+@_jit
+def _magnus_tetens_ice(temperature_c: float, temperature_k: float) -> float:
+    # Source: Murray, F. W., On the computation of saturation vapor pressure, J. Appl. Meteorol., 6, 203-204, 1967.
+    # p_saturation = 10.**(9.5 * temperature_c/(265.5+temperature_c) + 0.7858)         ; Murray quotes this as the original formula and
+    return 6.1078 * math.exp(
+        21.8745584
+        * (temperature_k - _TEMPERATURE_TRIPLE_POINT)
+        / (temperature_k - 7.66)
+    )  # this as the mathematical equivalent in the form of base e.
+
+
+@_jit
+def _buck_ice(temperature_c: float, temperature_k: float) -> float:
+    # Bucks vapor pressure formulation based on Tetens formula
+    # Source: Buck, A. L., New equations for computing vapor pressure and enhancement factor, J. Appl. Meteorol., 20, 1527-1532, 1981.
+    return 6.1115 * math.exp(22.452 * temperature_c / (272.55 + temperature_c))
+
+
+@_jit
+def _buck2_ice(temperature_c: float, temperature_k: float) -> float:
+    # Bucks vapor pressure formulation based on Tetens formula
+    # Source: Buck Research, Model CR-1A Hygrometer Operating Manual, Sep 2001
+    return 6.1115 * math.exp(
+        (23.036 - temperature_c / 333.7) * temperature_c / (279.82 + temperature_c)
+    )
+
+
+@_jit
+def _cimo_ice(temperature_c: float, temperature_k: float) -> float:
+    # Source: Annex 4B, Guide to Meteorological Instruments and Methods of Observation, WMO Publication No 8, 7th edition, Geneva, 2008. (CIMO Guide)
+    return 6.112 * math.exp(22.46 * temperature_c / (272.62 + temperature_c))
+
+
+@_jit
+def _wmo_ice(temperature_c: float, temperature_k: float) -> float:
+    # WMO formulation, which is very similar to Goff Gratch
+    # Source : WMO technical regulations, WMO-NO 49, Vol I, General Meteorological Standards and Recommended Practices, Aug 2000, App. A.
+    ratio = _TEMPERATURE_TRIPLE_POINT / temperature_k
+
+    # 10 ** x is evaluated as exp(x * ln(10))
+    return math.exp(
+        _LN10
+        * (
+            -9.09685 * (ratio - 1.0)
+            - 3.56654 * math.log10(ratio)
+            + 0.87682 * (1.0 - temperature_k * _INVERSE_TEMPERATURE_TRIPLE_POINT)
+            + 0.78614
+        )
+    )
+
+
+@_jit
+def _sonntag_ice(temperature_c: float, temperature_k: float) -> float:
+    # Source: Sonntag, D., Advancements in the field of hygrometry, Meteorol. Z., N. F., 3, 51-66, 1994.
+    return math.exp(
+        -6024.5282 / temperature_k
+        + 24.721994
+        + temperature_k * (1.0613868e-2 - 1.3198825e-5 * temperature_k)
+        - 0.49382577 * math.log(temperature_k)
+    )
+
+
+@_jit
+def _murphy_koop_ice(temperature_c: float, temperature_k: float) -> float:
+    # Source : Murphy and Koop, Review of the vapour pressure of ice and supercooled water for atmospheric applications, Q. J. R. Meteorol. Soc (2005), 131, pp. 1539-1565.
+    return (
+        math.exp(
+            9.550426
+            - 5723.265 / temperature_k
+            + 3.53068 * math.log(temperature_k)
+            - 0.00728332 * temperature_k
+        )
+        / 100.0
+    )
+
+
+@_jit
+def _mcidas_ice(temperature_c: float, temperature_k: float) -> float:
+    # Source : Unknown, Received from Xin Jin <xjin@ssec.wisc.edu>
+    E = _horner(temperature_c, _MCIDAS_ICE_COEFFICIENTS)
+    return math.exp(_LN10 * E)
+
+
+class Formula(IntEnum):
+    """[saturation vapor pressure formulas.]
+
+    Accepted wherever a formula name is, e.g. `formula=Formula.GoffGratch`. A member is
+    a typed alias for its name and is looked up by that name; plain ints are rejected.
+    Callers evaluating a fixed formula in a tight loop should use `vapor_pressure_function`.
+    """
+
+    HylandWexler = 0
+    Hardy = 1
+    Preining = 2
+    Wexler = 3
+    GoffGratch = 4
+    CIMO = 5
+    MagnusTetens = 6
+    Buck = 7
+    Buck2 = 8
+    WMO = 9
+    WMO2000 = 10
+    Sonntag = 11
+    Bolton = 12
+    Fukuta = 13
+    IAPWS = 14
+    MurphyKoop = 15
+    McIDAS = 16
+    MartiMauersberger = 17
+
+    def __str__(self) -> str:
+        return self.name
+
+
+_LIQUID = {
+    "HylandWexler": _hyland_wexler_liquid,
+    "Hardy": _hardy_liquid,
+    "Preining": _preining_liquid,
+    "Wexler": _wexler_liquid,
+    "GoffGratch": _goff_gratch_liquid,
+    "CIMO": _cimo_liquid,
+    "MagnusTetens": _magnus_tetens_liquid,
+    "Buck": _buck_liquid,
+    "Buck2": _buck2_liquid,
+    "WMO": _wmo_liquid,
+    "WMO2000": _wmo2000_liquid,
+    "Sonntag": _sonntag_liquid,
+    "Bolton": _bolton_liquid,
+    "Fukuta": _fukuta_liquid,
+    "IAPWS": _iapws_liquid,
+    "MurphyKoop": _murphy_koop_liquid,
+    "McIDAS": _mcidas_liquid,
+    # Marti and Mauersberger don't have a vapor pressure curve over liquid; use Goff Gratch instead
+    "MartiMauersberger": _goff_gratch_liquid,
+}
+
+_ICE = {
+    "MartiMauersberger": _marti_mauersberger_ice,
+    "HylandWexler": _hyland_wexler_ice,
+    "Wexler": _wexler_ice,
+    "Hardy": _hardy_ice,
+    "GoffGratch": _goff_gratch_ice,
+    "MagnusTetens": _magnus_tetens_ice,
+    "Buck": _buck_ice,
+    "Buck2": _buck2_ice,
+    "CIMO": _cimo_ice,
+    "WMO": _wmo_ice,
+    "WMO2000": _wmo_ice,  # There is no typo issue in the WMO formulations for ice
+    "Sonntag": _sonntag_ice,
+    "MurphyKoop": _murphy_koop_ice,
+    "McIDAS": _mcidas_ice,
+    # IAPWS does not provide a vapor pressure formulation over ice; use Goff Gratch instead
+    "IAPWS": _goff_gratch_ice,
+}
+
+# Default uses Hyland and Wexler over liquid.
+# While this may not be the best formula, it is consistent with what Vaisala uses in their system
+# Default uses Goff Gratch over ice.
+# There is little ambiguity in the ice saturation curve. Goff Gratch is widely used.
+_DEFAULTS = {"liquid": "HylandWexler", "ice": "GoffGratch"}
+_SURFACES = {"liquid": "liquid water surface", "ice": "ice surface"}
+
+# Names indexed by `Formula`, cheaper than the `name` property of the members
+_FORMULA_NAMES = tuple(formula.name for formula in Formula)
+
+
+def _flat_kernel_table(
+    liquid: Dict[str, Callable], ice: Dict[str, Callable]
+) -> Dict[Tuple[str, Optional[str]], Callable]:
+    """[merge the kernels of both phases into one table keyed by (phase, formula).]
+
+    Args:
+        liquid (Dict[str, Callable]): [kernels over liquid water by formula name]
+        ice (Dict[str, Callable]): [kernels over ice by formula name]
+
+    Returns:
+        Dict[Tuple[str, Optional[str]], Callable]: [kernels by phase and formula name, None for the default of the phase]
+    """
+    table = {}
+    for phase, kernels in (("liquid", liquid), ("ice", ice)):
+        table[phase, None] = kernels[_DEFAULTS[phase]]
+        for name, kernel in kernels.items():
+            table[phase, name] = kernel
+    return table
+
+
+# Scalar kernels by (phase, formula name), `Formula` members are looked up by their name
+_KERNELS = _flat_kernel_table(_LIQUID, _ICE)
+
+
+def _unknown_kernel(phase: str, formula: Optional[Union[str, Formula]]) -> ValueError:
+    """[build the error for a phase and formula missing from `_KERNELS`.]
+
+    Args:
+        phase (str): [phase of water surface]
+        formula (Optional[Union[str, Formula]]): [formula used to calculate saturation pressure]
+
+    Returns:
+        ValueError: [error to raise]
+    """
+    if phase not in _SURFACES:
+        return ValueError("Phase of water must be either `liquid` or `ice`.")
+    return ValueError(
+        f"Unknown formula for saturation pressure over {_SURFACES[phase]}: {formula}"
+    )
 
 
 def vapor_pressure_elementwise(
-    temperature_c: float, phase: str = "liquid", formula: Optional[str] = None
+    temperature_c: float,
+    phase: str = "liquid",
+    formula: Optional[Union[str, Formula]] = None,
 ) -> float:
     """[calculate the saturation vapor pressure, element-wise.]
 
     Args:
         temperature_c (float): [current temperature [degree C]]
         phase (str, optional): [phase of water surface]. Defaults to "liquid".
-        formula (Optional[str], optional): [formula used to calculate saturation pressure]. Defaults to None.
+        formula (Optional[Union[str, Formula]], optional): [formula used to calculate saturation pressure]. Defaults to None.
 
     Raises:
         ValueError: [unrecognized formula name over liquid water]
@@ -48,535 +712,1126 @@ def vapor_pressure_elementwise(
     """
 
     temperature_k: float = temperature_c + 273.15  # Most formulas use T in [K]
-    temperature_triple_point: float = 273.16  # triple point in K
 
-    # Formulas using [C] use the variable temperature_c
+    # Validated for every temperature, before any of the shortcuts below
+    if isinstance(formula, Formula):
+        formula = _FORMULA_NAMES[formula]
+    try:
+        kernel = _KERNELS[phase, formula]
+    except (KeyError, TypeError):  # TypeError for unhashable formulas
+        raise _unknown_kernel(phase, formula) from None
 
-    # Calculate saturation pressure over liquid water ----------------------------
+    if not temperature_k > 0:
+        # At and below absolute zero (or NaN), independent of numba being installed
+        return math.nan
 
-    if phase == "liquid":
-        # Default uses Hyland and Wexler over liquid.
-        # While this may not be the best formula, it is consistent with what Vaisala uses in their system
+    if phase == "ice" and temperature_c > 0:
+        # Independent of the formula used for ice,
+        # use Hyland Wexler (water) for temperatures above freezing (see above)
+        return _hyland_wexler_liquid(temperature_c, temperature_k)
 
-        if formula is None:
-            formula = "HylandWexler"
+    return kernel(temperature_c, temperature_k)
 
-        if formula == "MartiMauersberger":
-            # Goff Gratch formulation
-            # Source : Smithsonian Meteorological Tables, 5th edition, p. 350, 1984
-            # From original source: Goff and Gratch (1946), p. 107.
 
-            return vapor_pressure_elementwise(
-                temperature_c=temperature_c, phase="liquid", formula="GoffGratch"
-            )
+def _kernel_key(
+    phase: str, formula: Optional[Union[str, Formula]]
+) -> Tuple[str, Optional[str]]:
+    """[validate a phase and formula and return their key in `_KERNELS`.]
 
-        elif formula == "HylandWexler":
-            # Source Hyland, R. W. and A. Wexler, Formulations for the Thermodynamic Properties of the saturated Phases of H2O from 173.15K to 473.15K, ASHRAE Trans, 89(2A), 500-519, 1983.
-            return (
-                math.exp(
-                    -0.58002206e4 / temperature_k
-                    + 0.13914993e1
-                    - 0.48640239e-1 * temperature_k
-                    + 0.41764768e-4 * temperature_k ** 2.0
-                    - 0.14452093e-7 * temperature_k ** 3.0
-                    + 0.65459673e1 * math.log(temperature_k)
-                )
-                / 100.0
-            )
+    Memoized builders take this key instead of the raw arguments. `Formula` members
+    hash and compare equal to plain ints, so caching on the raw formula would let an
+    int through once the member with the same value has been requested.
 
-        elif formula == "Hardy":
-            # Source Hardy, B., 1998, ITS-90 Formulations for Vapor Pressure, Frostpoint temperature, Dewpoint temperature, and Enhancement Factors in the Range −100 to 100° C.
-            # The Proceedings of the Third International Symposium on Humidity & Moisture, London, England
-            return (
-                math.exp(
-                    -2.8365744e3 / temperature_k ** 2
-                    - 6.028076559e3 / temperature_k
-                    + 1.954263612e1
-                    - 2.737830188e-2 * temperature_k
-                    + 1.6261698e-5 * temperature_k ** 2
-                    + 7.0229056e-10 * temperature_k ** 3
-                    - 1.8680009e-13 * temperature_k ** 4
-                    + 2.7150305 * math.log(temperature_k)
-                )
-                / 100.0
-            )
+    Args:
+        phase (str): [phase of water surface]
+        formula (Optional[Union[str, Formula]]): [formula used to calculate saturation pressure]
 
-        elif formula == "Preining":
-            # Source : Vehkamaeki, H., M. Kulmala, I. Napari, K. E. J. Lehtinen, C.Timmreck, M. Noppel, and A. Laaksonen (2002), J. Geophys. Res., 107, doi:10.1029/2002JD002184.
-            return (
-                math.exp(
-                    -7235.424651 / temperature_k
-                    + 77.34491296
-                    + 5.7113e-3 * temperature_k
-                    - 8.2 * math.log(temperature_k)
-                )
-                / 100.0
-            )
+    Raises:
+        ValueError: [unrecognized formula name over liquid water]
+        ValueError: [unrecognized formula name over ice]
 
-        elif formula == "Wexler":
-            # Wexler, A., Vapor Pressure Formulation for Water in Range 0 to 100 C. A Revision, Journal of Research of the National Bureau of Standards - A. Physics and Chemistry, September - December 1976, Vol. 80A, Nos.5 and 6, 775-785
-            # The line of `T**4` was corrected from '-' to '+' following the original citation. (HV 20140819). The change makes only negligible difference
-            return (
-                math.exp(
-                    -0.29912729e4 * temperature_k ** (-2.0)
-                    - 0.60170128e4 * temperature_k ** (-1.0)
-                    + 0.1887643854e2 * temperature_k ** 0.0
-                    - 0.28354721e-1 * temperature_k ** 1.0
-                    + 0.17838301e-4 * temperature_k ** 2.0
-                    - 0.84150417e-9 * temperature_k ** 3.0
-                    + 0.44412543e-12 * temperature_k ** 4.0
-                    + 2.858487 * math.log(temperature_k)
-                )
-                / 100.0
-            )
+    Returns:
+        Tuple[str, Optional[str]]: [phase and formula name, None for the default of the phase]
+    """
+    if isinstance(formula, Formula):
+        formula = _FORMULA_NAMES[formula]
+    try:
+        _KERNELS[phase, formula]
+    except (KeyError, TypeError):  # TypeError for unhashable formulas
+        raise _unknown_kernel(phase, formula) from None
+    return phase, formula
 
-        elif formula == "GoffGratch":
-            # Goff Gratch formulation
-            # Source : Smithsonian Meteorological Tables, 5th edition, p. 350, 1984
-            # From original source: Goff and Gratch (1946), p. 107.
-            temperature_steam_point = 373.16  # steam point temperature in K
-            # saturation pressure at steam point temperature, normal atmosphere
-            e_water_saturation = 1013.246
-
-            return 10.0 ** (
-                -7.90298 * (temperature_steam_point / temperature_k - 1.0)
-                + 5.02808 * math.log10(temperature_steam_point / temperature_k)
-                - 1.3816e-7
-                * (
-                    10.0 ** (11.344 * (1.0 - temperature_k / temperature_steam_point))
-                    - 1.0
-                )
-                + 8.1328e-3
-                * (
-                    10.0 ** (-3.49149 * (temperature_steam_point / temperature_k - 1))
-                    - 1.0
-                )
-                + math.log10(e_water_saturation)
-            )
 
-        elif formula == "CIMO":
-            # Source: Annex 4B, Guide to Meteorological Instruments and Methods of Observation, WMO Publication No 8, 7th edition, Geneva, 2008. (CIMO Guide)
-            return 6.112 * math.exp(17.62 * temperature_c / (243.12 + temperature_c))
-
-        elif formula == "MagnusTetens":
-            # Source: Murray, F. W., On the computation of saturation vapor pressure, J. Appl. Meteorol., 6, 203-204, 1967.
-            # p_saturation = 10.**(7.5*(temperature_c)/(temperature_c+237.5) + 0.7858)         ; Murray quotes this as the original formula and
-            return 6.1078 * math.exp(
-                17.269388
-                * (temperature_k - temperature_triple_point)
-                / (temperature_k - 35.86)
-            )  # this as the mathematical equivalent in the form of base e.
-
-        elif formula == "Buck":
-            # Bucks vapor pressure formulation based on Tetens formula
-            # Source: Buck, A. L., New equations for computing vapor pressure and enhancement factor, J. Appl. Meteorol., 20, 1527-1532, 1981.
-            return 6.1121 * math.exp(17.502 * temperature_c / (240.97 + temperature_c))
-
-        elif formula == "Buck2":
-            # Bucks vapor pressure formulation based on Tetens formula
-            # Source: Buck Research, Model CR-1A Hygrometer Operating Manual, Sep 2001
-            return 6.1121 * math.exp(
-                (18.678 - temperature_c / 234.5)
-                * temperature_c
-                / (257.14 + temperature_c)
-            )
+def _element_kernel(phase: str, formula: Optional[str]) -> Callable[[float], float]:
+    """[bind the scalar kernel of a formula to a function of temperature [C].]
 
-        elif formula == "WMO":
-            # Intended WMO formulation, originally published by Goff (1957)
-            # incorrectly referenced by WMO technical regulations, WMO-NO 49, Vol I, General Meteorological Standards and Recommended Practices, App. A, Corrigendum Aug 2000.
-            # and incorrectly referenced by WMO technical regulations, WMO-NO 49, Vol I, General Meteorological Standards and Recommended Practices, App. A, 1988.
+    Args:
+        phase (str): [phase of water surface]
+        formula (Optional[str]): [formula name validated by `_kernel_key`]
 
-            return 10.0 ** (
-                10.79574 * (1.0 - temperature_triple_point / temperature_k)
-                - 5.02800 * math.log10(temperature_k / temperature_triple_point)
-                + 1.50475e-4
-                * (
-                    1.0
-                    - 10.0
-                    ** (-8.2969 * (temperature_k / temperature_triple_point - 1.0))
-                )
-                + 0.42873e-3
-                * (
-                    10.0
-                    ** (+4.76955 * (1.0 - temperature_triple_point / temperature_k))
-                    - 1.0
-                )
-                + 0.78614
-            )
+    Returns:
+        Callable[[float], float]: [plain python function mapping temperature [degree C] to saturation vapor pressure [hPa]]
+    """
+    kernel = _KERNELS[phase, formula]
 
-        elif formula == "WMO2000":
-            # WMO formulation, which is very similar to Goff Gratch
-            # Source : WMO technical regulations, WMO-NO 49, Vol I, General Meteorological Standards and Recommended Practices, App. A, Corrigendum Aug 2000.
+    if phase == "ice":
 
-            return 10.0 ** (
-                10.79574 * (1.0 - temperature_triple_point / temperature_k)
-                - 5.02800 * math.log10(temperature_k / temperature_triple_point)
-                + 1.50475e-4
-                * (
-                    1.0
-                    - 10.0
-                    ** (-8.2969 * (temperature_k / temperature_triple_point - 1.0))
-                )
-                + 0.42873e-3
-                * (
-                    10.0
-                    ** (-4.76955 * (1.0 - temperature_triple_point / temperature_k))
-                    - 1.0
-                )
-                + 0.78614
-            )
+        def element(temperature_c):
+            temperature_k = temperature_c + 273.15
+            if not temperature_k > 0:
+                # NaN at and below absolute zero, as in `vapor_pressure_elementwise`
+                return math.nan
+            if temperature_c > 0:
+                # Hyland Wexler (water) above freezing, as in `vapor_pressure_elementwise`
+                return _hyland_wexler_liquid(temperature_c, temperature_k)
+            return kernel(temperature_c, temperature_k)
 
-        elif formula == "Sonntag":
-            # Source: Sonntag, D., Advancements in the field of hygrometry, Meteorol. Z., N. F., 3, 51-66, 1994.
-            return math.exp(
-                -6096.9385 * temperature_k ** (-1.0)
-                + 16.635794
-                - 2.711193e-2 * temperature_k ** 1.0
-                + 1.673952e-5 * temperature_k ** 2.0
-                + 2.433502 * math.log(temperature_k)
-            )
+    else:
 
-        elif formula == "Bolton":
-            # Source: Bolton, D., The computation of equivalent potential temperature, Monthly Weather Report, 108, 1046-1053, 1980. equation (10)
-            return 6.112 * math.exp(17.67 * temperature_c / (temperature_c + 243.5))
+        def element(temperature_c):
+            temperature_k = temperature_c + 273.15
+            if not temperature_k > 0:
+                # NaN at and below absolute zero, as in `vapor_pressure_elementwise`
+                return math.nan
+            return kernel(temperature_c, temperature_k)
 
-        elif formula == "Fukuta":
-            # Source: Fukuta, N. and C. M. Gramada, Vapor pressure measurement of supercooled water, J. Atmos. Sci., 60, 1871-1875, 2003.
-            # This paper does not give a vapor pressure formulation, but rather a correction over the Smithsonian Tables.
-            # Thus calculate the table value first, then use the correction to get to the measured value.
-            if temperature_c < -39.0:
-                return np.nan
+    return element
 
-            else:
-                pressure_saturation_goff_gratch = vapor_pressure_elementwise(
-                    temperature_c=temperature_c, phase="liquid", formula="GoffGratch"
-                )
 
-                x = temperature_c + 19
-                return pressure_saturation_goff_gratch * (
-                    0.9992
-                    + 7.113e-4 * x
-                    - 1.847e-4 * x ** 2.0
-                    + 1.189e-5 * x ** 3.0
-                    + 1.130e-7 * x ** 4.0
-                    - 1.743e-8 * x ** 5.0
-                )
+def vapor_pressure_function(
+    phase: str = "liquid",
+    formula: Optional[Union[str, Formula]] = None,
+) -> Callable[[float], float]:
+    """[resolve a formula once and return a function calculating the saturation vapor pressure.]
 
-        elif formula == "IAPWS":
-            # Source: Wagner W. and A. Pruss (2002), The IAPWS formulation 1995 for the thermodynamic properties of ordinary water substance for general and scientific use, J. Phys. Chem. Ref. Data, 31(2), 387-535.
-            # This is the 'official' formulation from the International Association for the Properties of Water and Steam
-            # The valid range of this formulation is 273.16 <= T <= 647.096 K and is based on the ITS90 temperature scale.
-            # temperature at the critical point [K]
-            temperature_critical_point = 647.096
-            pressure_critical_point = (
-                22.064 * 1e4
-            )  # Vapor pressure at the critical point [hPa]
-            nu = 1 - temperature_k / temperature_critical_point
-            a1 = -7.85951783
-            a2 = 1.84408259
-            a3 = -11.7866497
-            a4 = 22.6807411
-            a5 = -15.9618719
-            a6 = 1.80122502
-            return pressure_critical_point * math.exp(
-                temperature_critical_point
-                / temperature_k
-                * (
-                    a1 * nu
-                    + a2 * nu ** 1.5
-                    + a3 * nu ** 3.0
-                    + a4 * nu ** 3.5
-                    + a5 * nu ** 4.0
-                    + a6 * nu ** 7.5
-                )
-            )
+    The phase and formula are validated here instead of on every call, so loops over
+    scalar temperatures skip the lookup. The returned function is compiled by numba if
+    it is installed, and can then also be called from other numba functions.
 
-        elif formula == "MurphyKoop":
-            # Source : Murphy and Koop, Review of the vapour pressure of ice and supercooled water for atmospheric applications, Q. J. R. Meteorol. Soc (2005), 131, pp. 1539-1565.
-            return (
-                math.exp(
-                    54.842763
-                    - 6763.22 / temperature_k
-                    - 4.210 * math.log(temperature_k)
-                    + 0.000367 * temperature_k
-                    + math.tanh(0.0415 * (temperature_k - 218.8))
-                    * (
-                        53.878
-                        - 1331.22 / temperature_k
-                        - 9.44523 * math.log(temperature_k)
-                        + 0.014025 * temperature_k
-                    )
-                )
-                / 100.0
+    Args:
+        phase (str, optional): [phase of water surface]. Defaults to "liquid".
+        formula (Optional[Union[str, Formula]], optional): [formula used to calculate saturation pressure]. Defaults to None.
+
+    Raises:
+        ValueError: [unrecognized formula name over liquid water]
+        ValueError: [unrecognized formula name over ice]
+
+    Returns:
+        Callable[[float], float]: [function mapping temperature [degree C] to saturation vapor pressure [hPa]]
+    """
+    return _compiled_element_kernel(*_kernel_key(phase, formula))
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_element_kernel(
+    phase: str, formula: Optional[str]
+) -> Callable[[float], float]:
+    """[compile the function of `vapor_pressure_function` once per validated key.]
+
+    Args:
+        phase (str): [phase of water surface]
+        formula (Optional[str]): [formula name validated by `_kernel_key`]
+
+    Returns:
+        Callable[[float], float]: [function mapping temperature [degree C] to saturation vapor pressure [hPa]]
+    """
+    return _jit(_element_kernel(phase, formula), cache=False)
+
+
+@_jit
+def vapor_pressure_liquid_default(temperature_c: float) -> float:
+    """[calculate the saturation vapor pressure over liquid water with the default formula.]
+
+    Specialization of `vapor_pressure_elementwise` for the default, Hyland and Wexler over
+    liquid water, without any dispatch. Compiled by numba and cached on disk if numba is
+    installed.
+
+    Args:
+        temperature_c (float): [current temperature [degree C]]
+
+    Returns:
+        float: [value of calculated saturation vapor pressure [hPa]]
+    """
+    temperature_k = temperature_c + 273.15
+    if not temperature_k > 0:
+        # NaN at and below absolute zero, as in `vapor_pressure_elementwise`
+        return math.nan
+    return _hyland_wexler_liquid(temperature_c, temperature_k)
+
+
+# -------------------------------------------------------------------------------------------
+#    Array kernels
+# -------------------------------------------------------------------------------------------
+# The kernels below evaluate the same formulas as `vapor_pressure_elementwise`, but operate
+# on whole numpy arrays at once. Each kernel takes the temperature in [C] and in [K] and
+# returns the saturation vapor pressure in [hPa]. The result is written into `out` if it
+# is given, and into one of the kernel's own temporaries otherwise. See the scalar
+# kernels for the full source of every formula.
+
+
+def _horner_array(x: np.ndarray, coefficients: Tuple[float, ...]) -> np.ndarray:
+    """[evaluate a polynomial with Horner's scheme, in place on a single buffer.]
+
+    Args:
+        x (np.ndarray): [values to evaluate the polynomial at]
+        coefficients (Tuple[float, ...]): [coefficients in increasing powers of x]
+
+    Returns:
+        np.ndarray: [values of the polynomial]
+    """
+    result = np.full_like(x, coefficients[-1])
+    for coefficient in coefficients[-2::-1]:
+        result *= x
+        result += coefficient
+    return result
+
+
+def _hyland_wexler_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Hyland and Wexler (1983), over liquid water
+    exponent = (
+        -0.58002206e4 / temperature_k
+        + 0.13914993e1
+        + temperature_k
+        * (
+            -0.48640239e-1
+            + temperature_k * (0.41764768e-4 - 0.14452093e-7 * temperature_k)
+        )
+        + 0.65459673e1 * np.log(temperature_k)
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure /= 100.0
+    return pressure
+
+
+def _hardy_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Hardy (1998), over liquid water
+    exponent = (
+        (-6.028076559e3 - 2.8365744e3 / temperature_k) / temperature_k
+        + 1.954263612e1
+        + temperature_k
+        * (
+            -2.737830188e-2
+            + temperature_k
+            * (
+                1.6261698e-5
+                + temperature_k * (7.0229056e-10 - 1.8680009e-13 * temperature_k)
             )
+        )
+        + 2.7150305 * np.log(temperature_k)
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure /= 100.0
+    return pressure
 
-        elif formula == "McIDAS":
-            # Source : Unknown, Received from Xin Jin <xjin@ssec.wisc.edu>
-            A0 = 0.999996876e0
-            A1 = -0.9082695004e-2
-            A2 = 0.7873616869e-4
-            A3 = -0.6111795727e-6
-            A4 = 0.4388418740e-8
-            A5 = -0.2988388486e-10
-            A6 = 0.2187442495e-12
-            A7 = -0.1789232111e-14
-            A8 = 0.1111201803e-16
-            A9 = -0.3099457145e-19
-            B = 0.61078e1
-            S = A0 + temperature_c * (
-                A1
-                + temperature_c
-                * (
-                    A2
-                    + temperature_c
-                    * (
-                        A3
-                        + temperature_c
-                        * (
-                            A4
-                            + temperature_c
-                            * (
-                                A5
-                                + temperature_c
-                                * (
-                                    A6
-                                    + temperature_c
-                                    * (A7 + temperature_c * (A8 + temperature_c * A9))
-                                )
-                            )
-                        )
-                    )
-                )
+
+def _preining_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Vehkamaeki et al. (2002), over liquid water
+    exponent = (
+        -7235.424651 / temperature_k
+        + 77.34491296
+        + 5.7113e-3 * temperature_k
+        - 8.2 * np.log(temperature_k)
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure /= 100.0
+    return pressure
+
+
+def _wexler_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Wexler (1976), over liquid water
+    exponent = (
+        (-0.60170128e4 - 0.29912729e4 / temperature_k) / temperature_k
+        + 0.1887643854e2
+        + temperature_k
+        * (
+            -0.28354721e-1
+            + temperature_k
+            * (
+                0.17838301e-4
+                + temperature_k * (-0.84150417e-9 + 0.44412543e-12 * temperature_k)
             )
-            return B / S ** 8
+        )
+        + 2.858487 * np.log(temperature_k)
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure /= 100.0
+    return pressure
 
-        else:
-            raise ValueError(
-                f"Unknown formula for saturation pressure over liquid water surface: {formula}"
+
+def _goff_gratch_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Goff and Gratch (1946), over liquid water
+
+    ratio = _TEMPERATURE_STEAM_POINT / temperature_k
+    inverse_ratio = temperature_k * _INVERSE_TEMPERATURE_STEAM_POINT
+
+    # 10 ** x is evaluated as exp(x * ln(10)), and 10 ** x - 1 as expm1(x * ln(10))
+    exponent = _LN10 * (
+        -7.90298 * (ratio - 1.0)
+        + 5.02808 * np.log10(ratio)
+        - 1.3816e-7 * np.expm1(11.344 * _LN10 * (1.0 - inverse_ratio))
+        + 8.1328e-3 * np.expm1(-3.49149 * _LN10 * (ratio - 1.0))
+        + _LOG10_E_WATER_SATURATION
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    return pressure
+
+
+def _cimo_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # CIMO Guide (2008), over liquid water
+    exponent = 17.62 * temperature_c / (243.12 + temperature_c)
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure *= 6.112
+    return pressure
+
+
+def _magnus_tetens_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Murray (1967), over liquid water
+    exponent = (
+        17.269388
+        * (temperature_k - _TEMPERATURE_TRIPLE_POINT)
+        / (temperature_k - 35.86)
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure *= 6.1078
+    return pressure
+
+
+def _buck_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Buck (1981), over liquid water
+    exponent = 17.502 * temperature_c / (240.97 + temperature_c)
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure *= 6.1121
+    return pressure
+
+
+def _buck2_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Buck Research (2001), over liquid water
+    exponent = (
+        (18.678 - temperature_c / 234.5) * temperature_c / (257.14 + temperature_c)
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure *= 6.1121
+    return pressure
+
+
+def _wmo_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Intended WMO formulation, originally published by Goff (1957), over liquid water
+    ratio = _TEMPERATURE_TRIPLE_POINT / temperature_k
+    inverse_ratio = temperature_k * _INVERSE_TEMPERATURE_TRIPLE_POINT
+    exponent = _LN10 * (
+        10.79574 * (1.0 - ratio)
+        - 5.02800 * np.log10(inverse_ratio)
+        - 1.50475e-4 * np.expm1(-8.2969 * _LN10 * (inverse_ratio - 1.0))
+        + 0.42873e-3 * np.expm1(+4.76955 * _LN10 * (1.0 - ratio))
+        + 0.78614
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    return pressure
+
+
+def _wmo2000_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # WMO technical regulations (2000), over liquid water
+    ratio = _TEMPERATURE_TRIPLE_POINT / temperature_k
+    inverse_ratio = temperature_k * _INVERSE_TEMPERATURE_TRIPLE_POINT
+    exponent = _LN10 * (
+        10.79574 * (1.0 - ratio)
+        - 5.02800 * np.log10(inverse_ratio)
+        - 1.50475e-4 * np.expm1(-8.2969 * _LN10 * (inverse_ratio - 1.0))
+        + 0.42873e-3 * np.expm1(-4.76955 * _LN10 * (1.0 - ratio))
+        + 0.78614
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    return pressure
+
+
+def _sonntag_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Sonntag (1994), over liquid water
+    exponent = (
+        -6096.9385 / temperature_k
+        + 16.635794
+        + temperature_k * (-2.711193e-2 + 1.673952e-5 * temperature_k)
+        + 2.433502 * np.log(temperature_k)
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    return pressure
+
+
+def _bolton_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Bolton (1980), over liquid water
+    exponent = 17.67 * temperature_c / (temperature_c + 243.5)
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure *= 6.112
+    return pressure
+
+
+def _fukuta_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Fukuta and Gramada (2003), a correction over Goff Gratch, not defined below -39 C
+    x = temperature_c + 19
+    # Before `out`, which may be the input, is written
+    below_range = temperature_c < -39.0
+    pressure = _goff_gratch_liquid_array(temperature_c, temperature_k, out)
+    pressure *= 0.9992 + x * (
+        7.113e-4 + x * (-1.847e-4 + x * (1.189e-5 + x * (1.130e-7 - 1.743e-8 * x)))
+    )
+    # Mask in place rather than allocating a second array with np.where
+    np.putmask(pressure, below_range, np.nan)
+    return pressure
+
+
+def _iapws_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Wagner and Pruss (2002), over liquid water
+    nu = 1 - temperature_k * _INVERSE_TEMPERATURE_CRITICAL_POINT
+    nu_half = np.sqrt(nu)
+    nu_cubed = nu * nu * nu
+    exponent = (
+        _TEMPERATURE_CRITICAL_POINT
+        / temperature_k
+        * (
+            nu * (-7.85951783 + 1.84408259 * nu_half)
+            + nu_cubed
+            * (
+                -11.7866497
+                + 22.6807411 * nu_half
+                + nu * (-15.9618719 + 1.80122502 * nu_cubed * nu_half)
             )
+        )
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure *= _PRESSURE_CRITICAL_POINT
+    return pressure
 
-    elif phase == "ice":
-        # =============================================================================
-        # Calculate saturation pressure over ice -------------------------------------
-        if temperature_c <= 0:
-            # Independent of the formula used for ice,
-            # use Hyland Wexler (water) for temperatures above freezing (see above)
-            # Source Hyland, R. W. and A. Wexler, Formulations for the Thermodynamic Properties of the saturated Phases of H2O from 173.15K to 473.15K, ASHRAE Trans, 89(2A), 500-519, 1983.
-            return (
-                math.exp(
-                    -0.58002206e4 / temperature_k
-                    + 0.13914993e1
-                    - 0.48640239e-1 * temperature_k
-                    + 0.41764768e-4 * temperature_k ** 2.0
-                    - 0.14452093e-7 * temperature_k ** 3.0
-                    + 0.65459673e1 * math.log(temperature_k)
-                )
-                / 100.0
+
+def _murphy_koop_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Murphy and Koop (2005), over liquid water
+    log_temperature_k = np.log(temperature_k)
+    exponent = (
+        54.842763
+        - 6763.22 / temperature_k
+        - 4.210 * log_temperature_k
+        + 0.000367 * temperature_k
+        + np.tanh(0.0415 * (temperature_k - 218.8))
+        * (
+            53.878
+            - 1331.22 / temperature_k
+            - 9.44523 * log_temperature_k
+            + 0.014025 * temperature_k
+        )
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure /= 100.0
+    return pressure
+
+
+def _mcidas_liquid_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # McIDAS, over liquid water
+    S = _horner_array(temperature_c, _MCIDAS_LIQUID_COEFFICIENTS)
+    S *= S
+    S *= S
+    S *= S
+    return np.divide(0.61078e1, S, out=S if out is None else out)
+
+
+def _marti_mauersberger_ice_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Marti and Mauersberger (1993), over ice
+    pressure = np.exp(_LN10 * (-2663.5 / temperature_k + 12.537), out=out)
+    pressure /= 100.0
+    return pressure
+
+
+def _hyland_wexler_ice_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Hyland and Wexler (1983), over ice
+    exponent = (
+        -0.56745359e4 / temperature_k
+        + 0.63925247e1
+        + temperature_k
+        * (
+            -0.96778430e-2
+            + temperature_k
+            * (
+                0.62215701e-6
+                + temperature_k * (0.20747825e-8 - 0.94840240e-12 * temperature_k)
             )
+        )
+        + 0.41635019e1 * np.log(temperature_k)
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure /= 100.0
+    return pressure
 
-        else:
-            # Default uses Goff Gratch over ice.
-            # There is little ambiguity in the ice saturation curve. Goff Gratch is widely used.
-            if formula is None:
-                formula = "GoffGratch"
 
-            if formula == "WMO2000":
-                formula = (
-                    "WMO"  # There is no typo issue in the WMO formulations for ice
-                )
+def _wexler_ice_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Wexler (1977), over ice
+    exponent = (
+        -0.58653696e4 / temperature_k
+        + 0.2224103300e2
+        + temperature_k
+        * (
+            0.13749042e-1
+            + temperature_k * (-0.34031775e-4 + 0.26967687e-7 * temperature_k)
+        )
+        + 0.6918651 * np.log(temperature_k)
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure /= 100.0
+    return pressure
 
-            if formula == "IAPWS":
-                # IAPWS does not provide a vapor pressure formulation over ice; use Goff Gratch instead
-                formula = "GoffGratch"
-
-            if formula == "MartiMauersberger":
-                # Source : Marti, J. and K Mauersberger, A survey and new measurements of ice vapor pressure at temperatures between 170 and 250 K, GRL 20, 363-366, 1993.
-                return 10.0 ** (-2663.5 / temperature_k + 12.537) / 100.0
-
-            elif formula == "HylandWexler":
-                # Source Hyland, R. W. and A. Wexler, Formulations for the Thermodynamic Properties of the saturated Phases of H2O from 173.15K to 473.15K, ASHRAE Trans, 89(2A), 500-519, 1983.
-                return (
-                    math.exp(
-                        -0.56745359e4 / temperature_k
-                        + 0.63925247e1
-                        - 0.96778430e-2 * temperature_k
-                        + 0.62215701e-6 * temperature_k ** 2.0
-                        + 0.20747825e-8 * temperature_k ** 3.0
-                        - 0.94840240e-12 * temperature_k ** 4.0
-                        + 0.41635019e1 * math.log(temperature_k)
-                    )
-                    / 100.0
-                )
 
-            elif formula == "Wexler":
-                # Wexler, A., Vapor pressure formulation for ice, Journal of Research of the National Bureau of Standards-A. 81A, 5-20, 1977.
-                return (
-                    math.exp(
-                        -0.58653696e4 * temperature_k ** (-1.0)
-                        + 0.2224103300e2
-                        + 0.13749042e-1 * temperature_k ** 1.0
-                        - 0.34031775e-4 * temperature_k ** 2.0
-                        + 0.26967687e-7 * temperature_k ** 3.0
-                        + 0.6918651 * math.log(temperature_k)
-                    )
-                    / 100.0
-                )
+def _hardy_ice_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Hardy (1998), over ice
+    exponent = (
+        -0.58666426e4 / temperature_k
+        + 0.2232870244e2
+        + temperature_k
+        * (
+            0.139387003e-1
+            + temperature_k * (-0.34262402e-4 + 0.27040955e-7 * temperature_k)
+        )
+        + 0.67063522e-1 * np.log(temperature_k)
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure /= 100.0
+    return pressure
 
-            elif formula == "Hardy":
-                # Source Hardy, B., 1998, ITS-90 Formulations for Vapor Pressure, Frostpoint temperature, Dewpoint temperature, and Enhancement Factors in the Range 鈥�100 to +100 掳C, The Proceedings of the Third International Symposium on Humidity & Moisture, London, England
-                # These coefficients are updated to ITS90 based on the work by Bob Hardy at Thunder Scientific: http://www.thunderscientific.com/tech_info/reflibrary/its90formulas.pdf
-                # The difference to the older ITS68 coefficients used by Wexler is academic.
-                return (
-                    math.exp(
-                        -0.58666426e4 * temperature_k ** (-1.0)
-                        + 0.2232870244e2
-                        + 0.139387003e-1 * temperature_k ** 1.0
-                        - 0.34262402e-4 * temperature_k ** 2.0
-                        + 0.27040955e-7 * temperature_k ** 3.0
-                        + 0.67063522e-1 * math.log(temperature_k)
-                    )
-                    / 100.0
-                )
 
-            elif formula == "GoffGratch":
-                # Source : Smithsonian Meteorological Tables, 5th edition, p. 350, 1984
-                e_ice_0 = 6.1071  # hPa
+def _goff_gratch_ice_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Goff and Gratch (1946), over ice
+    ratio = _TEMPERATURE_TRIPLE_POINT / temperature_k
+    exponent = _LN10 * (
+        -9.09718 * (ratio - 1.0)
+        - 3.56654 * np.log10(ratio)
+        + 0.876793 * (1.0 - temperature_k * _INVERSE_TEMPERATURE_TRIPLE_POINT)
+        + _LOG10_E_ICE_0
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    return pressure
+
+
+def _magnus_tetens_ice_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Murray (1967), over ice
+    exponent = (
+        21.8745584
+        * (temperature_k - _TEMPERATURE_TRIPLE_POINT)
+        / (temperature_k - 7.66)
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure *= 6.1078
+    return pressure
+
+
+def _buck_ice_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Buck (1981), over ice
+    exponent = 22.452 * temperature_c / (272.55 + temperature_c)
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure *= 6.1115
+    return pressure
 
-                return 10.0 ** (
-                    -9.09718 * (temperature_triple_point / temperature_k - 1.0)
-                    - 3.56654 * math.log10(temperature_triple_point / temperature_k)
-                    + 0.876793 * (1.0 - temperature_k / temperature_triple_point)
-                    + math.log10(e_ice_0)
-                )
 
-            elif formula == "MagnusTetens":
-                # Source: Murray, F. W., On the computation of saturation vapor pressure, J. Appl. Meteorol., 6, 203-204, 1967.
-                # p_saturation = 10.**(9.5 * temperature_c/(265.5+temperature_c) + 0.7858)         ; Murray quotes this as the original formula and
-                return 6.1078 * math.exp(
-                    21.8745584
-                    * (temperature_k - temperature_triple_point)
-                    / (temperature_k - 7.66)
-                )  # this as the mathematical equivalent in the form of base e.
-
-            elif formula == "Buck":
-                # Bucks vapor pressure formulation based on Tetens formula
-                # Source: Buck, A. L., New equations for computing vapor pressure and enhancement factor, J. Appl. Meteorol., 20, 1527-1532, 1981.
-                return 6.1115 * math.exp(
-                    22.452 * temperature_c / (272.55 + temperature_c)
-                )
+def _buck2_ice_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Buck Research (2001), over ice
+    exponent = (
+        (23.036 - temperature_c / 333.7) * temperature_c / (279.82 + temperature_c)
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure *= 6.1115
+    return pressure
+
+
+def _cimo_ice_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # CIMO Guide (2008), over ice
+    exponent = 22.46 * temperature_c / (272.62 + temperature_c)
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure *= 6.112
+    return pressure
 
-            elif formula == "Buck2":
-                # Bucks vapor pressure formulation based on Tetens formula
-                # Source: Buck Research, Model CR-1A Hygrometer Operating Manual, Sep 2001
-                return 6.1115 * math.exp(
-                    (23.036 - temperature_c / 333.7)
-                    * temperature_c
-                    / (279.82 + temperature_c)
-                )
 
-            elif formula == "CIMO":
-                # Source: Annex 4B, Guide to Meteorological Instruments and Methods of Observation, WMO Publication No 8, 7th edition, Geneva, 2008. (CIMO Guide)
-                return 6.112 * math.exp(
-                    22.46 * temperature_c / (272.62 + temperature_c)
-                )
+def _wmo_ice_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # WMO technical regulations (2000), over ice
+    ratio = _TEMPERATURE_TRIPLE_POINT / temperature_k
+    exponent = _LN10 * (
+        -9.09685 * (ratio - 1.0)
+        - 3.56654 * np.log10(ratio)
+        + 0.87682 * (1.0 - temperature_k * _INVERSE_TEMPERATURE_TRIPLE_POINT)
+        + 0.78614
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    return pressure
+
+
+def _sonntag_ice_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Sonntag (1994), over ice
+    exponent = (
+        -6024.5282 / temperature_k
+        + 24.721994
+        + temperature_k * (1.0613868e-2 - 1.3198825e-5 * temperature_k)
+        - 0.49382577 * np.log(temperature_k)
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    return pressure
+
+
+def _murphy_koop_ice_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # Murphy and Koop (2005), over ice
+    exponent = (
+        9.550426
+        - 5723.265 / temperature_k
+        + 3.53068 * np.log(temperature_k)
+        - 0.00728332 * temperature_k
+    )
+    pressure = np.exp(exponent, out=exponent if out is None else out)
+    pressure /= 100.0
+    return pressure
+
+
+def _mcidas_ice_array(
+    temperature_c: np.ndarray,
+    temperature_k: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # McIDAS, over ice
+    E = _horner_array(temperature_c, _MCIDAS_ICE_COEFFICIENTS)
+    E *= _LN10
+    return np.exp(E, out=E if out is None else out)
+
+
+_ARRAY_LIQUID = {
+    "HylandWexler": _hyland_wexler_liquid_array,
+    "Hardy": _hardy_liquid_array,
+    "Preining": _preining_liquid_array,
+    "Wexler": _wexler_liquid_array,
+    "GoffGratch": _goff_gratch_liquid_array,
+    "CIMO": _cimo_liquid_array,
+    "MagnusTetens": _magnus_tetens_liquid_array,
+    "Buck": _buck_liquid_array,
+    "Buck2": _buck2_liquid_array,
+    "WMO": _wmo_liquid_array,
+    "WMO2000": _wmo2000_liquid_array,
+    "Sonntag": _sonntag_liquid_array,
+    "Bolton": _bolton_liquid_array,
+    "Fukuta": _fukuta_liquid_array,
+    "IAPWS": _iapws_liquid_array,
+    "MurphyKoop": _murphy_koop_liquid_array,
+    "McIDAS": _mcidas_liquid_array,
+    # Marti and Mauersberger don't have a vapor pressure curve over liquid; use Goff Gratch instead
+    "MartiMauersberger": _goff_gratch_liquid_array,
+}
+
+_ARRAY_ICE = {
+    "MartiMauersberger": _marti_mauersberger_ice_array,
+    "HylandWexler": _hyland_wexler_ice_array,
+    "Wexler": _wexler_ice_array,
+    "Hardy": _hardy_ice_array,
+    "GoffGratch": _goff_gratch_ice_array,
+    "MagnusTetens": _magnus_tetens_ice_array,
+    "Buck": _buck_ice_array,
+    "Buck2": _buck2_ice_array,
+    "CIMO": _cimo_ice_array,
+    "WMO": _wmo_ice_array,
+    "WMO2000": _wmo_ice_array,  # There is no typo issue in the WMO formulations for ice
+    "Sonntag": _sonntag_ice_array,
+    "MurphyKoop": _murphy_koop_ice_array,
+    "McIDAS": _mcidas_ice_array,
+    # IAPWS does not provide a vapor pressure formulation over ice; use Goff Gratch instead
+    "IAPWS": _goff_gratch_ice_array,
+}
+
+_ARRAY_KERNELS = _flat_kernel_table(_ARRAY_LIQUID, _ARRAY_ICE)
+
+
+def _resolve_array_kernel(
+    phase: str, formula: Optional[Union[str, Formula]]
+) -> Callable:
+    """[look up the array kernel for a phase and formula name.]
 
-            elif formula == "WMO":
-                # WMO formulation, which is very similar to Goff Gratch
-                # Source : WMO technical regulations, WMO-NO 49, Vol I, General Meteorological Standards and Recommended Practices, Aug 2000, App. A.
+    Args:
+        phase (str): [phase of water surface]
+        formula (Optional[Union[str, Formula]]): [formula used to calculate saturation pressure]
 
-                return 10.0 ** (
-                    -9.09685 * (temperature_triple_point / temperature_k - 1.0)
-                    - 3.56654 * math.log10(temperature_triple_point / temperature_k)
-                    + 0.87682 * (1.0 - temperature_k / temperature_triple_point)
-                    + 0.78614
-                )
+    Raises:
+        ValueError: [unrecognized formula name over liquid water]
+        ValueError: [unrecognized formula name over ice]
 
-            elif formula == "Sonntag":
-                # Source: Sonntag, D., Advancements in the field of hygrometry, Meteorol. Z., N. F., 3, 51-66, 1994.
-                return math.exp(
-                    -6024.5282 * temperature_k ** (-1.0)
-                    + 24.721994
-                    + 1.0613868e-2 * temperature_k ** 1.0
-                    - 1.3198825e-5 * temperature_k ** 2.0
-                    - 0.49382577 * math.log(temperature_k)
-                )
+    Returns:
+        Callable: [array kernel taking the temperature in [C] and [K]]
+    """
+    if isinstance(formula, Formula):
+        formula = _FORMULA_NAMES[formula]
+    try:
+        kernel = _ARRAY_KERNELS[phase, formula]
+    except (KeyError, TypeError):  # TypeError for unhashable formulas
+        raise _unknown_kernel(phase, formula) from None
+
+    if phase == "liquid" and formula == "MartiMauersberger":
+        print(
+            "Marti and Mauersberger don't have a vapor pressure curve over liquid. Using Goff Gratch instead"
+        )
+    elif phase == "ice" and formula == "IAPWS":
+        print(
+            "IAPWS does not provide a vapor pressure formulation over ice; use Goff Gratch instead"
+        )
 
-            elif formula == "MurphyKoop":
-                # Source : Murphy and Koop, Review of the vapour pressure of ice and supercooled water for atmospheric applications, Q. J. R. Meteorol. Soc (2005), 131, pp. 1539-1565.
-                return (
-                    math.exp(
-                        9.550426
-                        - 5723.265 / temperature_k
-                        + 3.53068 * math.log(temperature_k)
-                        - 0.00728332 * temperature_k
-                    )
-                    / 100.0
-                )
+    return kernel
 
-            elif formula == "McIDAS":
-                # Source : Unknown, Received from Xin Jin <xjin@ssec.wisc.edu>
-                A0 = 0.7859063157e0
-                A1 = 0.3579242320e-1
-                A2 = -0.1292820828e-3
-                A3 = 0.5937519208e-6
-                A4 = 0.4482949133e-9
-                A5 = 0.2176664827e-10
-                E = A0 + temperature_c * (
-                    A1
-                    + temperature_c
-                    * (
-                        A2
-                        + temperature_c
-                        * (A3 + temperature_c * (A4 + temperature_c * A5))
-                    )
-                )
-                return 10.0 ** E
 
-            else:
-                raise ValueError(
-                    f"Unknown formula for saturation pressure over ice surface: {formula}"
-                )
+def _evaluate_array_kernel(
+    phase: str,
+    kernel: Callable,
+    temperature_c: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """[evaluate a resolved array kernel on an at least 1-d floating point array.]
 
+    Args:
+        phase (str): [phase of water surface]
+        kernel (Callable): [array kernel returned by `_resolve_array_kernel`]
+        temperature_c (np.ndarray): [current temperature [degree C]]
+        out (Optional[np.ndarray], optional): [array to write the result into, same shape as `temperature_c`]. Defaults to None, a new array.
+
+    Returns:
+        np.ndarray: [value of calculated saturation vapor pressure [hPa]]
+    """
+    temperature_k = temperature_c + 273.15  # Most formulas use T in [K]
+    # Everything reading the input comes first, `out` may be the input array itself
+    below_absolute_zero = temperature_k <= 0
+
+    if phase == "ice":
+        # Same switch to Hyland Wexler (water) above freezing as in
+        # `vapor_pressure_elementwise`. Both curves are evaluated for the whole array
+        # and blended by mask instead of branching per element; NaN temperatures
+        # propagate through both curves and come out as NaN.
+        above_freezing = temperature_c > 0
+        pressure_liquid = _hyland_wexler_liquid_array(temperature_c, temperature_k)
+        pressure = kernel(temperature_c, temperature_k, out)
+        np.copyto(pressure, pressure_liquid, where=above_freezing)
     else:
-        raise ValueError("Phase of water must be either `liquid` or `ice`.")
+        pressure = kernel(temperature_c, temperature_k, out)
+
+    if below_absolute_zero.any():
+        # NaN at and below absolute zero, as in `vapor_pressure_elementwise`
+        np.putmask(pressure, below_absolute_zero, np.nan)
+
+    return pressure
+
+
+def vapor_pressure_ufunc(
+    phase: str = "liquid",
+    formula: Optional[Union[str, Formula]] = None,
+    target: str = "cpu",
+) -> np.ufunc:
+    """[build a numpy ufunc calculating the saturation vapor pressure, requires numba.]
+
+    The scalar kernel of the formula is compiled into a ufunc with `numba.vectorize`.
+    The ufunc broadcasts over arrays of any shape, accepts `out`, `where` and scalars,
+    and runs on several threads with `target="parallel"`. It is built on first request
+    and reused afterwards.
+
+    Args:
+        phase (str, optional): [phase of water surface]. Defaults to "liquid".
+        formula (Optional[Union[str, Formula]], optional): [formula used to calculate saturation pressure]. Defaults to None.
+        target (str, optional): [numba vectorize target, "cpu" or "parallel"]. Defaults to "cpu".
+
+    Raises:
+        ImportError: [numba is not installed]
+        ValueError: [unrecognized formula name over liquid water]
+        ValueError: [unrecognized formula name over ice]
+
+    Returns:
+        np.ufunc: [ufunc mapping temperature [degree C] to saturation vapor pressure [hPa]]
+    """
+    if numba is None:
+        raise ImportError("vapor_pressure_ufunc requires numba")
+
+    return _vectorized_element_kernel(*_kernel_key(phase, formula), target)
+
+
+@functools.lru_cache(maxsize=None)
+def _vectorized_element_kernel(
+    phase: str, formula: Optional[str], target: str
+) -> np.ufunc:
+    """[build the ufunc of `vapor_pressure_ufunc` once per validated key and target.]
+
+    Args:
+        phase (str): [phase of water surface]
+        formula (Optional[str]): [formula name validated by `_kernel_key`]
+        target (str): [numba vectorize target, "cpu" or "parallel"]
+
+    Returns:
+        np.ufunc: [ufunc mapping temperature [degree C] to saturation vapor pressure [hPa]]
+    """
+    return numba.vectorize(["float64(float64)"], target=target)(
+        _element_kernel(phase, formula)
+    )
+
 
 def vapor_pressure(
-    temperature_c: np.ndarray, phase: str = "liquid", formula: Optional[str] = None
-) -> np.ndarray:
+    temperature_c: np.ndarray,
+    phase: str = "liquid",
+    formula: Optional[Union[str, Formula]] = None,
+    dtype: type = np.float64,
+    out: Optional[np.ndarray] = None,
+) -> Union[float, np.ndarray]:
     """[calculate the saturation vapor pressure.]
 
     Args:
-        temperature_c (float): [current temperature [degree C]]
+        temperature_c (np.ndarray): [current temperature [degree C]]
         phase (str, optional): [phase of water surface]. Defaults to "liquid".
-        formula (Optional[str], optional): [formula used to calculate saturation pressure]. Defaults to None.
+        formula (Optional[Union[str, Formula]], optional): [formula used to calculate saturation pressure]. Defaults to None.
+        dtype (type, optional): [floating point type of the computation and the result, np.float32 halves memory traffic for large arrays]. Defaults to np.float64.
+        out (Optional[np.ndarray], optional): [preallocated array to write the result into, same shape as `temperature_c`, returned instead of a new array]. Defaults to None.
 
     Raises:
         ValueError: [unrecognized formula name over liquid water]
         ValueError: [unrecognized formula name over ice]
 
     Returns:
-        np.ndarray: [value of calculated saturation vapor pressure [hPa]]
+        Union[float, np.ndarray]: [value of calculated saturation vapor pressure [hPa], same shape as `temperature_c`, a float for scalar input]
     """
-    if phase == "liquid":
-        if formula == "MartiMauersberger":
-            print(
-                "Marti and Mauersberger don't have a vapor pressure curve over liquid. Using Goff Gratch instead"
-            )
-            formula = "GoffGratch"
-        return np.vectorize(pyfunc=vapor_pressure_elementwise)(
-            temperature_c=temperature_c, phase="liquid", formula=formula
+    kernel = _resolve_array_kernel(phase, formula)
+
+    if out is None and np.ndim(temperature_c) == 0 and np.dtype(dtype) == np.float64:
+        # A single temperature is cheaper through the scalar kernel than through numpy
+        return vapor_pressure_elementwise(float(temperature_c), phase, formula)
+
+    temperature_c = np.asarray(temperature_c, dtype=dtype)
+    scalar_input = temperature_c.ndim == 0
+    # The array kernels reuse their temporaries in place, which needs at least 1-d arrays
+    temperature_c = np.atleast_1d(temperature_c)
+
+    if out is not None:
+        _evaluate_array_kernel(phase, kernel, temperature_c, np.atleast_1d(out))
+        return out
+
+    pressure = _evaluate_array_kernel(phase, kernel, temperature_c)
+
+    if scalar_input:
+        return pressure.item()
+
+    return pressure
+
+
+def vapor_pressure_parallel(
+    temperature_c: np.ndarray,
+    phase: str = "liquid",
+    formula: Optional[Union[str, Formula]] = None,
+    n_jobs: Optional[int] = None,
+    dtype: type = np.float64,
+) -> Union[float, np.ndarray]:
+    """[calculate the saturation vapor pressure, split over several threads.]
+
+    The flattened input is cut into `n_jobs` contiguous slices which are evaluated
+    by the array kernels in a thread pool. numpy releases the GIL inside its ufuncs,
+    so the slices run concurrently without copying or pickling the data.
+
+    Args:
+        temperature_c (np.ndarray): [current temperature [degree C]]
+        phase (str, optional): [phase of water surface]. Defaults to "liquid".
+        formula (Optional[Union[str, Formula]], optional): [formula used to calculate saturation pressure]. Defaults to None.
+        n_jobs (Optional[int], optional): [number of threads]. Defaults to None, the number of CPUs.
+        dtype (type, optional): [floating point type of the computation and the result]. Defaults to np.float64.
+
+    Raises:
+        ValueError: [n_jobs below 1]
+        ValueError: [unrecognized formula name over liquid water]
+        ValueError: [unrecognized formula name over ice]
+
+    Returns:
+        Union[float, np.ndarray]: [value of calculated saturation vapor pressure [hPa], same shape as `temperature_c`, a float for scalar input]
+    """
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    elif n_jobs < 1:
+        raise ValueError(f"n_jobs must be at least 1, got {n_jobs}")
+
+    kernel = _resolve_array_kernel(phase, formula)
+
+    temperature_c = np.asarray(temperature_c, dtype=dtype)
+
+    temperature_flat = np.ascontiguousarray(temperature_c).reshape(-1)
+    pressure = np.empty_like(temperature_flat)
+    bounds = np.linspace(0, temperature_flat.size, n_jobs + 1).astype(int)
+
+    def evaluate_slice(start: int, stop: int) -> None:
+        _evaluate_array_kernel(
+            phase, kernel, temperature_flat[start:stop], pressure[start:stop]
         )
 
-    elif phase == "ice":
-        if formula == "IAPWS":
-            print(
-                "IAPWS does not provide a vapor pressure formulation over ice; use Goff Gratch instead"
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        # list() re-raises exceptions from the worker threads
+        list(executor.map(evaluate_slice, bounds[:-1], bounds[1:]))
+
+    if temperature_c.ndim == 0:
+        return pressure.item()
+
+    return pressure.reshape(temperature_c.shape)
+
+
+def vapor_pressure_matrix(
+    temperature_c: np.ndarray,
+    formulas: Sequence[Union[str, Formula]],
+    phase: str = "liquid",
+    dtype: type = np.float64,
+) -> np.ndarray:
+    """[calculate the saturation vapor pressure with several formulas side by side.]
+
+    All formulas are validated before anything is computed. The temperature in [K] and,
+    over ice, the Hyland Wexler curve above freezing are computed once and shared by all
+    formulas, and every formula writes straight into its row of the result.
+
+    Args:
+        temperature_c (np.ndarray): [current temperature [degree C]]
+        formulas (Sequence[Union[str, Formula]]): [formulas used to calculate saturation pressure, one row each]
+        phase (str, optional): [phase of water surface]. Defaults to "liquid".
+        dtype (type, optional): [floating point type of the computation and the result]. Defaults to np.float64.
+
+    Raises:
+        ValueError: [a single formula instead of a sequence of formulas]
+        ValueError: [unrecognized formula name over liquid water]
+        ValueError: [unrecognized formula name over ice]
+
+    Returns:
+        np.ndarray: [values of calculated saturation vapor pressure [hPa], shape (len(formulas),) + shape of `temperature_c`]
+    """
+    # A single name would be iterated character by character
+    if isinstance(formulas, (str, Formula)):
+        raise ValueError(
+            f"formulas must be a sequence of formulas, got the single formula {formulas}"
+        )
+
+    kernels = [_resolve_array_kernel(phase, formula) for formula in formulas]
+
+    temperature_c = np.asarray(temperature_c, dtype=dtype)
+    shape = temperature_c.shape
+    # At least 1-d for the array kernels, see `vapor_pressure`
+    temperature_c = np.atleast_1d(temperature_c)
+    temperature_k = temperature_c + 273.15  # Most formulas use T in [K]
+    pressure = np.empty(
+        (len(kernels),) + temperature_c.shape, dtype=temperature_c.dtype
+    )
+
+    if phase == "ice":
+        # Same switch to Hyland Wexler (water) above freezing as in `vapor_pressure`
+        above_freezing = temperature_c > 0
+        pressure_liquid = _hyland_wexler_liquid_array(temperature_c, temperature_k)
+
+    for row, kernel in zip(pressure, kernels):
+        kernel(temperature_c, temperature_k, row)
+        if phase == "ice":
+            np.copyto(row, pressure_liquid, where=above_freezing)
+
+    below_absolute_zero = temperature_k <= 0
+    if below_absolute_zero.any():
+        # NaN at and below absolute zero, as in `vapor_pressure_elementwise`
+        pressure[:, below_absolute_zero] = np.nan
+
+    return pressure.reshape((len(kernels),) + shape)
+
+
+class TabulatedVaporPressure:
+    """[saturation vapor pressure interpolated from a precomputed table.]
+
+    The formula is evaluated once on an evenly spaced temperature grid. Calls then only
+    locate the grid cell and interpolate linearly, without any exp or log, which pays
+    off for large arrays and the costlier formulas. With the default grid of 0.05 deg C,
+    which has a point at 0 deg C where the ice curve switches to liquid water, the
+    relative interpolation error stays around 1e-5. Over ice, the cell just above
+    0 deg C interpolates across the jump to the liquid water curve, and Fukuta is
+    inaccurate near 21 deg C where the formula itself nearly cancels. Temperatures
+    outside of the table give NaN.
+
+    Args:
+        phase (str, optional): [phase of water surface]. Defaults to "liquid".
+        formula (Optional[Union[str, Formula]], optional): [formula used to calculate saturation pressure]. Defaults to None.
+        temperature_min (float, optional): [lowest temperature of the table [degree C]]. Defaults to -100.0.
+        temperature_max (float, optional): [highest temperature of the table [degree C]]. Defaults to 100.0.
+        n_points (int, optional): [number of table points]. Defaults to 4001.
+
+    Raises:
+        ValueError: [fewer than two table points]
+        ValueError: [temperature_max not above temperature_min]
+        ValueError: [unrecognized formula name over liquid water]
+        ValueError: [unrecognized formula name over ice]
+    """
+
+    def __init__(
+        self,
+        phase: str = "liquid",
+        formula: Optional[Union[str, Formula]] = None,
+        temperature_min: float = -100.0,
+        temperature_max: float = 100.0,
+        n_points: int = 4001,
+    ) -> None:
+        if n_points < 2:
+            raise ValueError(f"The table needs at least two points, got {n_points}")
+        if not temperature_max > temperature_min:
+            raise ValueError(
+                f"temperature_max ({temperature_max}) must be above temperature_min ({temperature_min})"
             )
-            formula = "GoffGratch"
 
-        return np.vectorize(pyfunc=vapor_pressure_elementwise)(
-            temperature_c=temperature_c, phase="ice", formula=formula
+        self.temperature_min = float(temperature_min)
+        self.temperature_max = float(temperature_max)
+        self.inverse_step = (n_points - 1) / (
+            self.temperature_max - self.temperature_min
         )
+        self.table = vapor_pressure(
+            np.linspace(self.temperature_min, self.temperature_max, n_points),
+            phase=phase,
+            formula=formula,
+        )
+        self.slopes = np.diff(self.table)
+        # Indexing lists of Python floats is several times cheaper than indexing arrays
+        self._table_list = self.table.tolist()
+        self._slope_list = self.slopes.tolist()
+
+    def __call__(self, temperature_c: np.ndarray) -> Union[float, np.ndarray]:
+        """[interpolate the saturation vapor pressure.]
+
+        Args:
+            temperature_c (np.ndarray): [current temperature [degree C]]
+
+        Returns:
+            Union[float, np.ndarray]: [value of interpolated saturation vapor pressure [hPa], same shape as `temperature_c`, a float for scalar input]
+        """
+        last_cell = self.slopes.size - 1
+
+        if isinstance(temperature_c, (int, float)) or np.ndim(temperature_c) == 0:
+            temperature_c = float(temperature_c)
+            # Also false for NaN
+            if not self.temperature_min <= temperature_c <= self.temperature_max:
+                return math.nan
+            position = (temperature_c - self.temperature_min) * self.inverse_step
+            index = min(int(position), last_cell)
+            return (
+                self._table_list[index] + (position - index) * self._slope_list[index]
+            )
 
-    else:
-        raise ValueError("Phase of water must be either `liquid` or `ice`.")
\ No newline at end of file
+        temperature_c = np.asarray(temperature_c, dtype=np.float64)
+        outside = ~(
+            (temperature_c >= self.temperature_min)
+            & (temperature_c <= self.temperature_max)
+        )
+        position = temperature_c - self.temperature_min
+        position *= self.inverse_step
+        position[outside] = 0.0
+        index = position.astype(np.intp)
+        np.minimum(index, last_cell, out=index)
+        position -= index
+        pressure = self.slopes[index]
+        pressure *= position
+        pressure += self.table[index]
+        pressure[outside] = np.nan
+        return pressure
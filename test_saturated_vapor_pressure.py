@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from saturated_vapor_pressure import (
+    Formula,
+    _goff_gratch_ice,
+    vapor_pressure,
+    vapor_pressure_elementwise,
+    numba,
+    vapor_pressure_function,
+    vapor_pressure_matrix,
+    vapor_pressure_ufunc,
+)
+
+
+def test_ice_below_freezing_uses_the_ice_formula():
+    # Goff Gratch is the default over ice
+    expected = _goff_gratch_ice(-10.0, -10.0 + 273.15)
+    assert vapor_pressure_elementwise(-10.0, "ice") == expected
+    assert vapor_pressure(-10.0, "ice") == expected
+    np.testing.assert_allclose(
+        vapor_pressure(np.array([-10.0, -10.0]), "ice"), expected, rtol=1e-12
+    )
+
+
+def test_ice_above_freezing_uses_liquid_water():
+    expected = vapor_pressure_elementwise(10.0, "liquid")
+    assert vapor_pressure_elementwise(10.0, "ice") == expected
+    assert vapor_pressure(10.0, "ice") == vapor_pressure(10.0, "liquid")
+    np.testing.assert_allclose(
+        vapor_pressure(np.array([10.0, 10.0]), "ice"), expected, rtol=1e-12
+    )
+    np.testing.assert_array_equal(
+        vapor_pressure(np.array([10.0]), "ice"),
+        vapor_pressure(np.array([10.0]), "liquid"),
+    )
+
+
+def test_vapor_pressure_function_rejects_integer_formulas():
+    vapor_pressure_function("liquid", Formula.GoffGratch)
+    vapor_pressure_function("liquid", Formula.Hardy)
+    for formula in (4, True, ["GoffGratch"]):
+        with pytest.raises(ValueError):
+            vapor_pressure_function("liquid", formula)
+
+
+@pytest.mark.skipif(numba is None, reason="vapor_pressure_ufunc requires numba")
+def test_vapor_pressure_ufunc_rejects_integer_formulas():
+    vapor_pressure_ufunc("ice", Formula.Sonntag)
+    for formula in (11, ["X"]):
+        with pytest.raises(ValueError):
+            vapor_pressure_ufunc("ice", formula)
+
+
+def test_unknown_ice_formula_is_rejected_at_any_temperature():
+    for temperature_c in (-300.0, -5.0, 5.0):
+        with pytest.raises(ValueError):
+            vapor_pressure_elementwise(temperature_c, "ice", "Bolton")
+        with pytest.raises(ValueError):
+            vapor_pressure(temperature_c, "ice", "Bolton")
+
+
+def test_vapor_pressure_matrix_rejects_a_single_formula():
+    for formulas in ("GoffGratch", Formula.GoffGratch):
+        with pytest.raises(ValueError, match="single formula"):
+            vapor_pressure_matrix(np.array([-10.0, 10.0]), formulas)
+    assert vapor_pressure_matrix(np.array([-10.0, 10.0]), ["GoffGratch"]).shape == (
+        1,
+        2,
+    )